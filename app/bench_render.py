@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+import os
+import statistics
+import time
+import uuid
+from streamlit.testing.v1 import AppTest
+from chat_handler import ChatHandler
+
+TURN_COUNTS = [10, 50, 100, 200, 500]
+RUNS_PER_COUNT = 5
+
+def seeded_handler(turns: int, session_id: str) -> ChatHandler:
+    """Build a ChatHandler whose transcript already holds the given number of turns."""
+    handler = ChatHandler()
+    messages = handler.get_messages(session_id)
+    for i in range(turns):
+        messages.append({"role": "user", "content": f"Question {i}: how can I improve my headline?"})
+        messages.append({"role": "assistant", "content": f"Answer {i}: " + "Use concrete keywords and results. " * 20})
+    return handler
+
+def time_rerun(turns: int) -> float:
+    """Return the median wall time in ms of a full script rerun at the given conversation length."""
+    session_id = str(uuid.uuid4())
+    at = AppTest.from_file(os.path.join(os.path.dirname(__file__), "main.py"), default_timeout=30)
+    at.session_state["session_id"] = session_id
+    at.session_state["chat_handler"] = seeded_handler(turns, session_id)
+    at.session_state["profile_url"] = "https://www.linkedin.com/in/example"
+    at.run()  # Warm up imports and caches
+    timings = []
+    for _ in range(RUNS_PER_COUNT):
+        start = time.perf_counter()
+        at.run()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+def main():
+    """
+    Measures chat view rerun time as the conversation grows.
+
+    Seeds the session transcript directly, so no API keys or LLM calls are needed.
+    A flat column means rerun cost does not depend on the conversation length.
+    """
+    print(f"{'turns':>6} {'rerun (ms)':>12}")
+    for turns in TURN_COUNTS:
+        print(f"{turns:>6} {time_rerun(turns):>12.1f}")
+
+if __name__ == "__main__":
+    main()
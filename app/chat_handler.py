@@ -49,15 +49,34 @@ class ChatHandler:
 
         return workflow.compile(checkpointer=self.memory)
 
+    def _get_session(self, session_id: str) -> dict:
+        if session_id not in self.session_data:
+            self.session_data[session_id] = {
+                "profile_data": None,
+                "chat_history": [],  # Truncated history sent to the LLM
+                "messages": []  # Full transcript shown in the UI
+            }
+        return self.session_data[session_id]
+
+    def get_messages(self, session_id: str) -> list:
+        """
+        Return the full chat transcript for a session, oldest first.
+
+        This is the single source of truth for the UI; unlike "chat_history"
+        it is never truncated and holds the cleaned responses the user saw.
+        """
+        return self._get_session(session_id)["messages"]
+
     def handle_chat(self, profile_url: str, user_query: str, session_id: str):
-        try:
-            if session_id not in self.session_data:
-                self.session_data[session_id] = {
-                    "profile_data": None,
-                    "chat_history": []
-                }
+        session_info = self._get_session(session_id)
+        session_info["messages"].append({"role": "user", "content": user_query})
+        response = self._run_workflow(profile_url, user_query, session_id)
+        session_info["messages"].append({"role": "assistant", "content": response})
+        return response
 
-            session_info = self.session_data[session_id]
+    def _run_workflow(self, profile_url: str, user_query: str, session_id: str):
+        try:
+            session_info = self._get_session(session_id)
 
             state = {
                 "profile_url": profile_url,
@@ -139,6 +158,6 @@ class ChatHandler:
 
         return result.strip()
 
-def clear_session(self, session_id: str):
-    if session_id in self.session_data:
-        del self.session_data[session_id]
+    def clear_session(self, session_id: str):
+        if session_id in self.session_data:
+            del self.session_data[session_id]
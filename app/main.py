@@ -23,11 +23,36 @@ if "session_id" not in st.session_state:
     st.session_state.session_id = str(uuid.uuid4())
 if "chat_handler" not in st.session_state:
     st.session_state.chat_handler = ChatHandler()
-if "messages" not in st.session_state:
-    st.session_state.messages = []
 if "profile_url" not in st.session_state:
     st.session_state.profile_url = ""
 
+# Only the latest messages are rendered on every rerun; older ones are
+# paginated inside the history fragment so rerun cost stays flat.
+RECENT_MESSAGES = 10
+HISTORY_PAGE_SIZE = 20
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def render_message_block(messages: tuple) -> str:
+    """Join a page of (role, content) pairs into a single markdown block."""
+    blocks = []
+    for role, content in messages:
+        speaker = "🧑 **You**" if role == "user" else "🤖 **Assistant**"
+        blocks.append(f"{speaker}\n\n{content}")
+    return "\n\n---\n\n".join(blocks)
+
+@st.fragment
+def render_history(older_count: int):
+    """Show messages older than the recent window, one page at a time."""
+    messages = st.session_state.chat_handler.get_messages(st.session_state.session_id)
+    total_pages = (older_count - 1) // HISTORY_PAGE_SIZE + 1
+    with st.expander(f"Earlier messages ({older_count})"):
+        # Page 1 is the page right before the recent window
+        page = st.number_input("Page", min_value=1, max_value=total_pages, value=1, key="history_page")
+        end = older_count - (page - 1) * HISTORY_PAGE_SIZE
+        start = max(0, end - HISTORY_PAGE_SIZE)
+        block = tuple((m["role"], m["content"]) for m in messages[start:end])
+        st.markdown(render_message_block(block))
+
 def main():
     st.title("🚀 LearnTube - LinkedIn Profile Optimizer")
     st.markdown("*by CareerNinja*")
@@ -45,23 +70,27 @@ def main():
         if st.button("Load Profile", type="primary"):
             if profile_url:
                 st.session_state.profile_url = profile_url
-                st.session_state.messages = []  # Clear chat on new profile
+                # Clear chat and cached profile data on new profile
+                st.session_state.chat_handler.clear_session(st.session_state.session_id)
+                st.session_state.pop("history_page", None)
                 st.success("Profile loaded! Start chatting below.")
                 st.rerun()
     
     # Chat interface
     if st.session_state.profile_url:
         st.markdown("---")
-        # Display chat messages
-        for message in st.session_state.messages:
+        messages = st.session_state.chat_handler.get_messages(st.session_state.session_id)
+        older_count = max(0, len(messages) - RECENT_MESSAGES)
+        if older_count:
+            render_history(older_count)
+
+        # Display the most recent chat messages
+        for message in messages[-RECENT_MESSAGES:]:
             with st.chat_message(message["role"]):
                 st.markdown(message["content"])
         
         # Chat input
         if prompt := st.chat_input("Ask about your profile, job fit, career guidance..."):
-            # Add user message
-            st.session_state.messages.append({"role": "user", "content": prompt})
-            
             # Display user message
             with st.chat_message("user"):
                 st.markdown(prompt)
@@ -69,19 +98,13 @@ def main():
             # Generate response
             with st.chat_message("assistant"):
                 with st.spinner("Analyzing your profile..."):
+                    # The handler records both messages in the session transcript
                     response = st.session_state.chat_handler.handle_chat(
                         profile_url=st.session_state.profile_url,
                         user_query=prompt,
                         session_id=st.session_state.session_id
                     )
-                    
-                    if response:
-                        st.markdown(response)
-                        st.session_state.messages.append({"role": "assistant", "content": response})
-                    else:
-                        error_msg = "⚠️ Unable to process request. Please try again or check your LinkedIn URL."
-                        st.markdown(error_msg)
-                        st.session_state.messages.append({"role": "assistant", "content": error_msg})
+                    st.markdown(response or "⚠️ Unable to process request. Please try again or check your LinkedIn URL.")
     else:
         st.info("👆 Enter your LinkedIn profile URL above to start chatting with the AI assistant.")
         